@@ -278,6 +278,10 @@ Types = {
     'tuple'  : lambda value: isinstance(value, tuple  )
 }
 
+# Sentinels that disable the type check, probed before the Types dispatch
+DisabledTypes = frozenset([None, 'Null', 'None', 'any'])
+
+
 @register()
 def check_dtype(value, dtype):
     """
@@ -299,13 +303,23 @@ def check_dtype(value, dtype):
         Returns True if this value is the expected type. If it is not, returns
         either a string or list of strings describing the error.
     """
+    # Identity checks are cheaper than the dict probe for disabled dtypes
+    if dtype is Null or dtype is None:
+        return True
+
     if isinstance(dtype, list):
         if True not in [check_type(value, t) for t in dtype]:
             return f'Value type <{dtype!r}> is not one of {dtype}'
         return True
 
+    # String aliases that disable the check skip the dispatch below
+    if dtype in DisabledTypes:
+        return True
+
     # Try a builtin then fallback to custom registered
-    func = Types.get(dtype, funcs.Funcs.get(dtype))
+    func = Types.get(dtype)
+    if func is None:
+        func = funcs.Funcs.get(dtype)
     if func is None:
         return f'Unknown type: {dtype!r}'
 
@@ -13,6 +13,9 @@ Funcs = {}
 # Tracks which Config keys need to update their _f.checks list after initialization
 Checks = {}
 
+# Error value types kept by ErrorsDict.reduce, built once rather than per call
+ReduceTypes = (str, list)
+
 
 class ErrorsDict(dict):
     """
@@ -21,6 +24,10 @@ class ErrorsDict(dict):
     assist in resolving return type issues with custom functions by enforcing
     their return types to only be strings or lists.
     """
+    # Set True when a recorded result is a failure so callers can test for
+    # errors in O(1) instead of scanning with reduce()
+    failed = False
+
     def reduce(self):
         reduced = ErrorsDict()
         for key, val in self.items():
@@ -28,7 +35,7 @@ class ErrorsDict(dict):
                 new = val.reduce()
                 if new:
                     reduced[key] = new
-            elif isinstance(val, (str, list)):
+            elif isinstance(val, ReduceTypes):
                 reduced[key] = val
         return reduced
 
@@ -78,9 +85,10 @@ def getRegister(key):
     """
     Retrieves a function from the registers list
     """
-    if key not in Funcs:
+    func = Funcs.get(key)
+    if func is None:
         # Magic functions initialize at the end of mlky, don't report an error if these don't exist yet
         if not key.startswith('config.'):
             Logger.error(f'The following key is not a registered function, returning Null which may have unintended consequences: {key!r}')
         return Null
-    return Funcs[key]
+    return func
@@ -14,6 +14,9 @@ from . import (
 
 Logger = logging.getLogger(__file__)
 
+# Matches ${...} magics beginning with a valid starter token, compiled once
+Regex = re.compile(r"\${([\.\$\!].*?)}")
+
 
 @register(name='config.replace')
 def replace(value, instance=None):
@@ -77,9 +80,9 @@ def replace(value, instance=None):
         if value == '\\':
             return Null
 
-        matches = re.findall(r"\${([\.\$\!].*?)}", value)
-
-        for match in matches:
+        # Resolve each match once, then substitute them all in a single pass
+        lookups = {}
+        for match in Regex.findall(value):
             # Config lookup case
             if match.startswith('.'):
                 keys = match.split('.')
@@ -110,7 +113,10 @@ def replace(value, instance=None):
             else:
                 Logger.warning(f'Replacement matched to string but no valid starter token provided: {match!r}')
 
-            value = value.replace('${'+ match +'}', str(data))
+            lookups[match] = str(data)
+
+        if lookups:
+            value = Regex.sub(lambda m: lookups.get(m.group(1), m.group(0)), value)
 
     return value
 
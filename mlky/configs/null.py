@@ -6,6 +6,9 @@ import logging
 
 Logger = logging.getLogger(__file__)
 
+# Computed once so __hash__ doesn't recompute per dict probe
+NullHash = hash(None)
+
 
 class NullType(type):
     """
@@ -31,7 +34,7 @@ class NullType(type):
         return type(self)()
 
     def __hash__(cls):
-        return hash(None)
+        return NullHash
 
     def __bool__(cls):
         return False
@@ -43,7 +46,7 @@ class NullType(type):
         return False
 
     def __eq__(cls, other):
-        return type(other) in [type(None), type(cls)]
+        return other is cls or other is None or type(other) is type(cls)
 
     def __setattr__(cls, key, value):
         if key == '_warn':
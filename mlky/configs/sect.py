@@ -7,11 +7,19 @@ import copy
 import json
 import logging
 import os
+import re
 
 from pathlib import Path
 
 import yaml
 
+try:
+    # The libyaml C emitter is much faster and emits identical output for the
+    # standard types dumped here
+    from yaml import CDumper as YamlDumper
+except ImportError:
+    from yaml import Dumper as YamlDumper
+
 from . import (
     ErrorsDict,
     funcs,
@@ -26,6 +34,30 @@ from ..utils.templates import yamlHeader
 
 Logger = logging.getLogger(__file__)
 
+# Strings yaml emits as unquoted plain scalars, anything else falls back to
+# the emitter. Deliberately conservative
+PlainString = re.compile(r'^[A-Za-z_][A-Za-z0-9_\-./]*$').match
+
+# Plain-looking strings that yaml would reinterpret as other types
+YamlReserved = frozenset(['true', 'false', 'yes', 'no', 'on', 'off', 'null', 'none'])
+
+
+def fastScalar(value):
+    """
+    Formats common scalar values directly, skipping the yaml emitter which is
+    substantially slower for single-line output. Returns None when the value
+    needs yaml.dump to be represented safely
+    """
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return repr(value)
+    if isinstance(value, str) and PlainString(value) and value.lower() not in YamlReserved:
+        return value
+    return None
+
 
 class Sect:
     # Default values for when a subclass isn't fully initialized
@@ -96,6 +128,14 @@ class Sect:
         # Parse the input data from a supported type
         data = self.loadDict(data)
 
+        # Rewrapping an existing Sect adopts a copy of its state directly,
+        # skipping the attribute setup below that the copy would discard
+        if isinstance(data, Sect):
+            super().__setattr__('__dict__', data.deepCopy().__dict__)
+            if defs:
+                self.applyDefinition(defs)
+            return
+
         self.__dict__['_name'] = name
         self.__dict__['_data'] = data
         self.__dict__['_miss'] = missing
@@ -117,9 +157,6 @@ class Sect:
             for i, value in enumerate(data):
                 self._setdata(i, value, defs=defs)
 
-        elif isinstance(data, Sect):
-            super().__setattr__('__dict__', data.deepCopy().__dict__)
-
         if defs:
             self.applyDefinition(defs)
 
@@ -196,20 +233,20 @@ class Sect:
 
         if isinstance(val, Var):
             if var:
-                self._log(3, '__getattr__', f'[{key!r}] Returning as Var: {val}')
+                self._log(3, '__getattr__', '[%r] Returning as Var: %s', key, val)
                 return val
 
             if default and val.value is Null:
-                self._log(3, '__getattr__', f'[{key!r}] Returning {val}.default')
+                self._log(3, '__getattr__', '[%r] Returning %s.default', key, val)
                 return val.default
 
-            self._log(3, '__getattr__', f'[{key!r}] Returning {val}.value')
+            self._log(3, '__getattr__', '[%r] Returning %s.value', key, val)
             return val.value
 
         if not isinstance(val, (Sect, NullType)):
             self._log('e', '__getattr__', f'Item of _sect is not a Var, Sect, or Null type: [{key!r}] = {type(val)} {val}')
 
-        self._log(3, '__getattr__', f'[{key!r}] Returning value: {val!r}')
+        self._log(3, '__getattr__', '[%r] Returning value: %r', key, val)
         return val
 
     def __getitem__(self, key):
@@ -235,9 +272,13 @@ class Sect:
         cls = self.__class__
         new = cls.__new__(cls)
         memo[id(self)] = new
-        for key, val in self.__dict__.items():
-            self._log(1, '__deepcopy__', f'Deep copying __dict__[{key!r}] = {val!r}')
-            new.__dict__[key] = copy.deepcopy(val, memo)
+
+        # Only build the per-attribute messages when this level is enabled
+        if 1 in self._dbug or '__deepcopy__' in self._dbug:
+            for key, val in self.__dict__.items():
+                self._log(1, '__deepcopy__', f'Deep copying __dict__[{key!r}] = {val!r}')
+
+        new.__dict__.update(copy.deepcopy(self.__dict__, memo))
         return new
 
     def __delattr__(self, key):
@@ -313,14 +354,23 @@ class Sect:
         """
         return '  ' * (len(self._name.split('.')) - 1)
 
-    def _log(self, level, func, msg):
+    def _log(self, level, func, msg, *args):
         """
         Formats debug messages
+
+        Formatting is deferred until the level is known to be enabled, so hot
+        call sites can pass %-style args instead of prebuilt f-strings
         """
+        if level != 'e' and level not in self._dbug and func not in self._dbug:
+            return
+
+        if args:
+            msg = msg % args
+
         message = f'{self._offset}<{type(self).__name__}>({self._name}).{func}() {msg}'
         if level == 'e':
             Logger.error(message)
-        elif level in self._dbug or func in self._dbug:
+        else:
             Logger.debug(message)
 
     def _patch(self, other, inplace=True):
@@ -388,7 +438,7 @@ class Sect:
         name = self._subkey(key)
 
         # Retrieve this key from self if it exists
-        self._log(2, '_setdata', f'Retrieving if this key [{key!r}] already exists')
+        self._log(2, '_setdata', 'Retrieving if this key [%r] already exists', key)
         data = self._sect[key]
 
         # Var is the last resort type
@@ -598,23 +648,23 @@ class Sect:
         val = self.__getattr__(key, var=var, default=default)
 
         if val is Null:
-            self._log(3, 'get', f'[{key!r}] Val is Null, returning other: {other!r}')
+            self._log(3, 'get', '[%r] Val is Null, returning other: %r', key, other)
             return other
 
-        self._log(3, 'get', f'[{key!r}] Returning value: {val!r}')
+        self._log(3, 'get', '[%r] Returning value: %r', key, val)
         return val
 
     def keys(self):
         return self._sect.keys()
 
     def values(self, *args, **kwargs):
-        self._log(3, 'values', f'args={args}, kwargs={kwargs}')
+        self._log(3, 'values', 'args=%s, kwargs=%s', args, kwargs)
         return [self.__getattr__(key, *args, **kwargs) for key in self]
 
     def items(self, *args, **kwargs):
         """
         """
-        self._log(3, 'items', f'args={args}, kwargs={kwargs}')
+        self._log(3, 'items', 'args=%s, kwargs=%s', args, kwargs)
         return [(key, self.__getattr__(key, *args, **kwargs)) for key in self]
 
     def hasAttrs(self):
@@ -705,6 +755,99 @@ class Sect:
             else:
                 self._log('e', 'resetVars', f'Internal _sect has a value other than a Var or Sect: {key!r} = {item!r}')
 
+    def _rowFromSect(self, string, sect):
+        """
+        Reads a Sect and prepares a tuple that represents the row as the
+        following columns:
+            (string, flag, dtype, sdesc)
+        """
+        defs = sect._defs
+
+        sdesc = defs.get('sdesc', '')
+        dtype = defs.get('dtype', self._type.lower())
+
+        # ! = required, ? = optional under a required sect, ' ' = optional
+        flag = ' '
+        if defs.get('required'):
+            flag = '!'
+        else:
+            parent = sect._prnt
+            while parent is not Null:
+                if parent._defs.get('required'):
+                    flag = '?'
+                    break
+                parent = parent._prnt
+
+        return (string, flag, dtype, sdesc)
+
+    def _rowFromVar(self, key, var):
+        """
+        Reads a Var and prepares a tuple that represents the row as the
+        following columns:
+            (string, flag, dtype, sdesc)
+        where:
+            `string` is the "key: value" for this line
+            `flag` is one of:
+                ` ` - Completely optional key
+                `!` - Manually set value required
+                `?` - Optional child key of some required parent section
+            `dtype` is the set data type for this key
+            `sdesc` is the short description
+
+        This list of tuples is then processed by utils.printTable() to the
+        columns in alignment as a valid yaml
+        """
+        # Set value if set, otherwise use default, replace Null with `\`
+        value  = '\\'
+        if var.value is not Null:
+            value = var.value
+        elif var.default is not Null:
+            value = var.default
+
+        flag = ' '
+        if var.required:
+            flag = '!'
+        else:
+            parent = var.parent
+            while parent is not Null:
+                if parent._defs.get('required'):
+                    flag = '?'
+                    break
+                parent = parent._prnt
+
+        # Common scalars format directly, otherwise use yaml to dump correctly
+        scalar = fastScalar(value)
+        if self._type == 'List':
+            if scalar is None:
+                dumped = yaml.dump(value, Dumper=YamlDumper)
+                # The pure-Python dumper ends scalar documents with a '...'
+                # marker, the C dumper does not; strip whichever is present
+                if dumped.endswith('\n...\n'):
+                    dumped = dumped[:-5]
+                else:
+                    dumped = dumped.rstrip('\n')
+                strings = ['- ' + dumped]
+            else:
+                strings = [f'- {scalar}']
+        elif scalar is not None and isinstance(key, str) and PlainString(key) and key.lower() not in YamlReserved:
+            strings = [f'{key}: {scalar}']
+        else:
+            strings = yaml.dump({key: value}, Dumper=YamlDumper).split('\n')[:-1]
+
+        # If this is a list value, there will be multiple lines
+        others = []
+        if len(strings) > 1:
+            offset = var._offset + '  '
+            others = [
+                (offset+string, )
+                for string in strings[1:]
+            ]
+
+        # The main key line
+        string = var._offset + strings[0]
+
+        return [(string, flag, var.dtype or '', var.sdesc)] + others
+
     def dumpYaml(self, string=True):
         """
         Dumps this object as a YAML string.
@@ -735,96 +878,14 @@ class Sect:
         passed to `mlky.utils.printTable()`. See `Sect.generateTemplate()` for
         more information about this.
         """
-        def rowFromSect(string, sect):
-            """
-            Reads a Sect and prepares a tuple that represents the row as the
-            following columns:
-                (string, flag, dtype, sdesc)
-            """
-            defs = sect._defs
-
-            sdesc = defs.get('sdesc', '')
-            dtype = defs.get('dtype', self._type.lower())
-
-            # ! = required, ? = optional under a required sect, ' ' = optional
-            flag = ' '
-            if defs.get('required'):
-                flag = '!'
-            else:
-                parent = sect._prnt
-                while parent is not Null:
-                    if parent._defs.get('required'):
-                        flag = '?'
-                        break
-                    parent = parent._prnt
-
-            return (string, flag, dtype, sdesc)
-
-
-        def rowFromVar(var):
-            """
-            Reads a Var and prepares a tuple that represents the row as the
-            following columns:
-                (string, flag, dtype, sdesc)
-            where:
-                `string` is the "key: value" for this line
-                `flag` is one of:
-                    ` ` - Completely optional key
-                    `!` - Manually set value required
-                    `?` - Optional child key of some required parent section
-                `dtype` is the set data type for this key
-                `sdesc` is the short description
-
-            This list of tuples is then processed by utils.printTable() to the
-            columns in alignment as a valid yaml
-            """
-            # Set value if set, otherwise use default, replace Null with `\`
-            value  = '\\'
-            if var.value is not Null:
-                value = var.value
-            elif var.default is not Null:
-                value = var.default
-
-            flag = ' '
-            if var.required:
-                flag = '!'
-            else:
-                parent = var.parent
-                while parent is not Null:
-                    if parent._defs.get('required'):
-                        flag = '?'
-                        break
-                    parent = parent._prnt
-
-            # Use yaml to dump this correctly
-            if self._type == 'List':
-                strings = ['- ' + yaml.dump(value)[:-5]]
-            else:
-                strings = yaml.dump({key: value}).split('\n')[:-1]
-
-            # If this is a list value, there will be multiple lines
-            others = []
-            if len(strings) > 1:
-                offset = var._offset + '  '
-                others = [
-                    (offset+string, )
-                    for string in strings[1:]
-                ]
-
-            # The main key line
-            string = var._offset + strings[0]
-
-            return [(string, flag, var.dtype or '', var.sdesc)] + others
-
-
         dump = [('generated:', 'K', 'dtype', 'Short description')]
         for key, item in self._sect.items():
             if isinstance(item, Sect):
                 # `key` is not in the item, create the "key: value" string for the row tuple
-                dump.append(rowFromSect(f'{item._offset}{key}:', item))
+                dump.append(self._rowFromSect(f'{item._offset}{key}:', item))
                 dump += item.dumpYaml(string=False)[1:]
             elif isinstance(item, Var):
-                dump += rowFromVar(item)
+                dump += self._rowFromVar(key, item)
             else:
                 self._log('e', 'dumpYaml', f'Internal _sect has a value other than a Var or Sect: {key!r} = {item!r}')
 
@@ -0,0 +1,26 @@
+"""
+Tests the mlky magics replacement syntax
+"""
+import pytest
+
+from mlky import (
+    Config,
+    Null
+)
+from mlky.configs.funcs import getRegister
+
+
+@pytest.mark.parametrize('string,expected', [
+    ('${.a}'            , '1'     ),
+    ('${.b.c}'          , '2'     ),
+    ('x/${.a}/${.b.c}'  , 'x/1/2' ),
+    ('no magic'         , 'no magic'),
+    ('\\'               , Null    ),
+])
+def test_replace(string, expected):
+    """
+    Tests the config.replace register against a single parametrized table
+    instead of one test per syntax case
+    """
+    Config({'a': 1, 'b': {'c': 2}})
+    assert getRegister('config.replace')(string) == expected
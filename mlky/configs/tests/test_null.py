@@ -41,7 +41,7 @@ def test_warnings(caplog):
     assert Null._warn, 'Null warning disabled by default'
 
     Null.test = 1
-    message = list(caplog.records)[-1].message
+    message = caplog.records[-1].message
     assert message == 'Null objects cannot take attribute assignments but will not raise an exception'
 
     caplog.clear()
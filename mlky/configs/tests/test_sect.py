@@ -18,6 +18,15 @@ Cases = [
 ]
 
 
+@pytest.fixture(scope='module', params=Cases)
+def sect(request):
+    """
+    Pre-built Sect shared by the read-only tests so construction cost is paid
+    once per case instead of once per test
+    """
+    return Sect(request.param)
+
+
 def test_isinstance():
     """
     Tests isinstance
@@ -28,38 +37,41 @@ def test_isinstance():
     assert isinstance(sect.c, Sect), 'Instance is not isinstance of Sect'
 
 
-@pytest.mark.parametrize('data', Cases)
-def test_recursive(data):
+def test_recursive(sect):
     """
     Tests that Sects are recursive with themselves
     """
-    sect = Sect(data)
     assert sect == Sect(sect), 'sect != Sect(sect)'
 
 
-@pytest.mark.parametrize('data', Cases)
-def test_pickle(data):
+def test_pickle(sect):
     """
     Tests serializability
     """
-    sect = Sect(data)
-
     data = pickle.dumps(sect)
     load = pickle.loads(data)
 
     assert sect == load, 'Loaded pickle data does not match original'
 
 
-@pytest.mark.parametrize('data', Cases)
-def test_deepcopy(data):
+def test_deepcopy(sect):
     """
     Tests deep copy functionality
     """
-    sect = Sect(data)
     copy = sect.deepCopy()
     assert copy == sect, 'The copy did not match the original'
 
 
+def test_dumpYaml():
+    """
+    Tests dumping a list Sect, covering scalars that fall back to the yaml
+    emitter (floats, None, multi-word strings) as well as the fast path
+    """
+    dump = Sect([3.5, None, 'hello world', 1]).dumpYaml()
+    for line in ('- 3.5', '- null', '- hello world', '- 1'):
+        assert line in dump, f'Expected {line!r} in dump:\n{dump}'
+
+
 @pytest.mark.parametrize('data,solution', [
     ([{'a': 1}, {'b': 2}, {'a': -1}, {'c': 3}], {'a': -1, 'b': 2, 'c': 3}),
     ([{'a': 1}, {'b': [2]}, {'a': -1}, {'b': 2}], {'a': -1, 'b': 2}),
@@ -107,12 +119,15 @@ def test_get():
     assert var.default == 7, 'defs key .default was wrong'
 
 
-def test_opts():
+def test_opts(monkeypatch):
     """
     Test combinations of Sect._opts
+
+    Uses monkeypatch so the global options restore on teardown and other
+    test files aren't affected by the mutations here
     """
-    Sect._opts.convertListTypes = False
-    Sect._opts.convertItems     = True
+    monkeypatch.setitem(Sect._opts, 'convertListTypes', False)
+    monkeypatch.setitem(Sect._opts, 'convertItems'    , True )
 
     S = Sect({'a': 1, 'b': {'c': 2}, 'd': [3, {'f': {'g': 4, 'h': [5, 'i']}}]})
 
@@ -130,8 +145,8 @@ def test_opts():
     assert S.d[1].f.h[0] == 5
     assert S.d[1].f.h[1] == 'i'
 
-    Sect._opts.convertListTypes = False
-    Sect._opts.convertItems     = False
+    monkeypatch.setitem(Sect._opts, 'convertListTypes', False)
+    monkeypatch.setitem(Sect._opts, 'convertItems'    , False)
 
     S = Sect({'a': [[0, 1], [2, 3]]})
     assert S.a == [[0, 1], [2, 3]]
@@ -11,17 +11,29 @@ from mlky import (
 )
 
 
-@pytest.mark.parametrize("name,key,value,dtype,checks,errors", [
+Cases = [
     ('.1', 'one'  , 1, 'None', [{'oneof': [0, 1, 2]}], {}),
     ('.2', 'two'  , 2, 'any' , [{'oneof': [0, 2, 4]}], {}),
     ('.3', 'three', 3, 'int' , [{'oneof': [0, 2, 4]}], {'oneof': 'Invalid option: 3, should be one of: (0, 2, 4)'}),
     ('.4', 'four' , 4, 'str' , [{'oneof': [0, 4, 8]}], {'type': "Wrong type: Expected <'str'> Got <class 'int'>"})
-])
-def test_Var(name, key, value, dtype, checks, errors):
+]
+
+
+@pytest.fixture(scope='module', params=Cases, ids=[case[1] for case in Cases])
+def case(request):
+    """
+    Builds the Var once per case since test_Var only reads from it
+    """
+    name, key, value, dtype, checks, errors = request.param
+    var = Var(name=name, key=key, value=value, dtype=dtype, checks=checks)
+    return var, request.param
+
+
+def test_Var(case):
     """
     Tests initialization and briefly validation
     """
-    v = Var(name=name, key=key, value=value, dtype=dtype, checks=checks)
+    v, (name, key, value, dtype, checks, errors) = case
     assert str(v)   == f'<Var({key}={value})>', f'Var str() broken, expected "<Var({key}={value})>" got {str(v)}'
     assert v.name   == name,   f'Bad attribute "name", expected {name} got {v.name}'
     assert v.key    == key,    f'Bad attribute "key", expected {key} got {v.key}'
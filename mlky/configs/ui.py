@@ -29,69 +29,32 @@ header = pn.Row(
 )
 
 #%%
-# left  = pn.Spacer(styles=dict(background='grey'))
-rows = []
-for line in lines:
-    # Split the key and value
-    key, *val = line[0].split(': ')
-    val = ': '.join(val) # Rejoin in case this substring was in the value
-
-    # Value Pane
-    styles = {}
-    vpane = pn.pane.Str(val, width_policy='max', styles=styles)
-
-    # Key Pane
-    styles = {}
-    if not val:
-        styles['background'] = 'LightBlue'
-    kpane = pn.pane.Str(key, width_policy='max', styles=styles)
-
-    # Row: key pane left, value pane right, each 50% width
-    row = pn.Row(kpane, vpane, width_policy='max')
-    rows.append(row)
-
-left = pn.Column(*rows, styles={'background': 'Gainsboro'}, scroll=True)
-#%%
-
-data = []
-for line in lines:
-    # Split the key and value
-    key, *val = line[0].split(': ')
-    val = ': '.join(val) # Rejoin in case this substring was in the value
-
-    # Is section
-    if not val:
-        key = key[:-1]
-
-    data.append([key, val])
-
-df    = pd.DataFrame(data, columns=['Key', 'Value'])
-table = pn.widgets.Tabulator(df, layout='fit_columns')
-left  = pn.Column(table, styles={'background': 'Gainsboro'}, scroll=True)
-#%%
-
-lvls = int(max(flags, key=lambda flag: flag['level'])['level'])
-data = []
+# Resolve each row's level once instead of per loop iteration
+levels = [int(flag['level']) for flag in flags]
+lvls   = max(levels)
+data   = []
 for i, line in enumerate(lines):
     lvl = [''] * lvls
 
-    # Split the key and value
-    key, *val = line[0].split(': ')
-
-    # Rejoin in case this substring was in the value
-    val = ': '.join(val)
+    # Split the key and value, partition leaves the value intact if the
+    # separator substring appears again
+    key, _, val = line[0].partition(': ')
 
     # Is section
     if not val:
         key = key[:-1]
 
     # Assign
-    lvl[int(flags[i]['level']) - 1] = key
+    lvl[levels[i] - 1] = key
 
     data.append(lvl + [val])
 
-df = pd.DataFrame(data, columns=[f'Level {i}' for i in range(lvls)] + ['Value'])
-df = df.set_index(list(df.columns[:-1]))
+# Build the MultiIndex directly, skipping the DataFrame->set_index round-trip
+index = pd.MultiIndex.from_arrays(
+    [[row[i] for row in data] for i in range(lvls)],
+    names = [f'Level {i}' for i in range(lvls)]
+)
+df    = pd.DataFrame({'Value': [row[-1] for row in data]}, index=index)
 table = pn.widgets.Tabulator(df, hierarchical=True, layout='fit_columns')
 left  = pn.Column(table, styles={'background': 'Gainsboro'}, scroll=True)
 
@@ -3,6 +3,9 @@ Var objects are containers to hold values of a mlky Sect
 """
 import copy
 import logging
+import sys
+
+from functools import lru_cache
 
 from . import (
     ErrorsDict,
@@ -13,12 +16,55 @@ from . import (
 
 Logger = logging.getLogger(__file__)
 
+# Immutable types that don't need copy.deepcopy in __deepcopy__
+Immutable = frozenset([bool, int, float, complex, str, bytes, type(None)])
+
+# Shared no-argument sentinels for checks that don't take parameters
+EmptyArgs   = ()
+EmptyKwargs = {}
+
+# Shared return for validations that have nothing to report, treated as
+# immutable by convention so the common all-pass path skips an allocation
+EmptyErrors = ErrorsDict()
+
+
+@lru_cache(maxsize=16)
+def debugSet(level):
+    """
+    Caches the debug levels set per integer level since most Vars of a Config
+    share the same few levels
+    """
+    return frozenset(range(0, level + 1))
+
+# Resolved lazily by getSect() since sect.py imports this module first
+Sect = None
+
+
+def getSect():
+    """
+    Retrieves the Sect class, importing it on first use to avoid the circular
+    import at module load
+    """
+    global Sect
+    if Sect is None:
+        from .sect import Sect
+    return Sect
+
 
 class Var:
-    value    = Null
-    debug    = set()
-    missing  = True
-    required = False
+    # Slots shrink per-instance memory and speed attribute access, which adds
+    # up for Configs carrying thousands of Vars. Every attribute, including
+    # those set from definitions files, must be listed here
+    __slots__ = (
+        'name', 'key', 'value', 'default', 'dtype', 'required', 'missing',
+        'checks', 'debug', 'sdesc', 'ldesc', 'parent', 'original',
+        '_offs',  # Cached _offset string, None until computed
+        '_parsed' # Checks parsed to (name, args, kwargs) tuples
+    )
+
+    # Public state only, the _offs/_parsed caches are derived and excluded
+    # from comparisons and exports
+    _fields = __slots__[:-2]
 
     def __init__(self, name, key,
         value    = Null,
@@ -42,8 +88,14 @@ class Var:
             Use the default Var.__setattr__ which will call replace() on `value`
             If `False`, circumvents Var.__setattr__ by using super().__setattr__
         """
+        # Seed the slot so check functions reading var.value during the
+        # init-time validate see Null, as the old class attribute provided
+        super().__setattr__('value', Null)
+
         if isinstance(debug, int):
-            debug = range(0, debug+1)
+            debug = debugSet(debug)
+        else:
+            debug = frozenset(debug)
 
         self.name     = name
         self.key      = key
@@ -52,7 +104,7 @@ class Var:
         self.required = required
         self.missing  = missing
         self.checks   = checks
-        self.debug    = set(debug)
+        self.debug    = debug
         self.sdesc    = sdesc
         self.ldesc    = ldesc
         self.parent   = parent
@@ -66,20 +118,35 @@ class Var:
             super().__setattr__('value', value)
 
     def __eq__(self, other):
-        data = self.toDict()
         if isinstance(other, dict):
-            return data == other
+            return self.toDict() == other
         elif isinstance(other, self.__class__):
-            return data == other.toDict()
+            # Field-by-field short-circuits on the first mismatch without
+            # building intermediate dicts
+            return all(
+                getattr(self, key, Null) == getattr(other, key, Null)
+                for key in self._fields
+            )
         return False
 
     def __deepcopy__(self, memo):
         cls = self.__class__
         new = cls.__new__(cls)
         memo[id(self)] = new
-        for key, val in self.__dict__.items():
-            self._debug(1, '__deepcopy__', f'Deep copying __dict__[{key!r}] = {val!r}')
-            new.__dict__[key] = copy.deepcopy(val, memo)
+
+        debug = 1 in self.debug or '__deepcopy__' in self.debug
+        for key in self.__slots__:
+            if hasattr(self, key):
+                val = getattr(self, key)
+                if debug:
+                    self._debug(1, '__deepcopy__', f'Deep copying {key!r} = {val!r}')
+                # Immutable values copy as themselves, skip the deepcopy call
+                if val is Null or val.__class__ in Immutable:
+                    object.__setattr__(new, key, val)
+                else:
+                    # object.__setattr__ skips the replace/validate in __setattr__
+                    object.__setattr__(new, key, copy.deepcopy(val, memo))
+
         return new
 
     def __reduce__(self):
@@ -92,21 +159,38 @@ class Var:
     def deepReplace(self, value):
         """
         Calls reset on the children of this Var's value if it is a list type
+
+        Iterates with an explicit worklist instead of recursing so deeply
+        nested lists avoid per-frame call overhead and the recursion limit
         """
-        for i, item in enumerate(value):
-            if 'Sect' in str(type(item)):
-                self._debug(2, 'deepReplace', f'Resetting {item}')
-                item.resetVars()
+        # Resolve once instead of per item, and test the common types first
+        sect  = getSect()
+        stack = [value]
+        while stack:
+            value = stack.pop()
+
+            # Flat lists of plain scalars are very common and need no work at
+            # all, detect them with a single cheap scan first
+            for item in value:
+                if isinstance(item, (str, list, tuple, sect)):
+                    break
+            else:
+                continue
 
-            elif isinstance(item, str):
-                new = self.replace(item)
-                if new is not None:
-                    self._debug(2, 'deepReplace', f'Replacing index [{i}] {item!r} with {new!r}')
-                    value[i] = new
+            for i, item in enumerate(value):
+                if isinstance(item, str):
+                    new = self.replace(item)
+                    if new is not None:
+                        self._debug(2, 'deepReplace', 'Replacing index [%s] %r with %r', i, item, new)
+                        value[i] = new
+
+                elif isinstance(item, (list, tuple)):
+                    self._debug(2, 'deepReplace', 'Descending into child list %s', item)
+                    stack.append(item)
 
-            elif isinstance(item, (list, tuple)):
-                self._debug(2, 'deepReplace', f'Calling deepReplace on child list {item}')
-                self.deepReplace(item)
+                elif isinstance(item, sect):
+                    self._debug(2, 'deepReplace', 'Resetting %s', item)
+                    item.resetVars()
 
     def __setattr__(self, key, value):
         """
@@ -114,7 +198,12 @@ class Var:
         if key == 'value':
             # Lists to Sects disabled, perform a deep replacement
             if isinstance(value, (list, tuple)):
-                self.original = copy.deepcopy(value)
+                # A shallow copy is an equivalent snapshot when every item is
+                # an immutable scalar, which is the common case
+                if type(value) is list and all(item.__class__ in Immutable for item in value):
+                    self.original = value.copy()
+                else:
+                    self.original = copy.deepcopy(value)
                 self.deepReplace(value)
             else:
                 # Always call to see if this value should be replaced
@@ -126,9 +215,37 @@ class Var:
             # No longer missing if it's set
             self.missing = False
 
-            # Non-empty dict means errors found
-            if self.validate(value).reduce():
-                Logger.error(f'Changing the value of this Var({self.name}) will cause validation to fail. See var.validate() for errors.')
+            # Plain Vars with no checks or dtype cannot fail, skip the dispatch
+            if self.checks or not (self.dtype is Null or self.dtype is None):
+                # The failed flag is set during validate, skipping a reduce() scan
+                if self.validate(value).failed:
+                    Logger.error(f'Changing the value of this Var({self.name}) will cause validation to fail. See var.validate() for errors.')
+
+        elif key == 'checks':
+            # Parse the YAML check forms once so validate() iterates flat
+            # tuples; reassignment (including +=) keeps the parse in sync.
+            # String names are interned so the registry lookups and error
+            # dict insertions compare by identity
+            parsed = []
+            for check in value:
+                args   = EmptyArgs
+                kwargs = EmptyKwargs
+                if isinstance(check, dict):
+                    (check, args), = check.items()
+                    if isinstance(args, dict):
+                        kwargs = args
+                        args   = EmptyArgs
+
+                if isinstance(check, str):
+                    check = sys.intern(check)
+
+                parsed.append((check, args, kwargs))
+
+            object.__setattr__(self, '_parsed', parsed)
+
+        elif key == 'name' or key == 'key':
+            # Invalidate the cached offset
+            object.__setattr__(self, '_offs', None)
 
         super().__setattr__(key, value)
 
@@ -166,21 +283,37 @@ class Var:
     def _offset(self):
         """
         Offset in spaces to denote hierarchical level
+
+        Cached until name or key changes since it is read per debug message
         """
-        name = len(self.name.split('.'))
-        if isinstance(self.key, int):
-            name += 1
-            key = 1
-        else:
-            key = len(self.key.split('.'))
+        offs = getattr(self, '_offs', None)
+        if offs is None:
+            name = len(self.name.split('.'))
+            if isinstance(self.key, int):
+                name += 1
+                key = 1
+            else:
+                key = len(self.key.split('.'))
+
+            offs = '  ' * (name - key)
+            object.__setattr__(self, '_offs', offs)
 
-        return '  ' * (name - key)
+        return offs
 
-    def _debug(self, level, func, msg):
+    def _debug(self, level, func, msg, *args):
         """
         Formats debug messages
+
+        Formatting is deferred until the level is known to be enabled, so hot
+        call sites can pass %-style args instead of prebuilt f-strings
         """
-        if level in self.debug or func in self.debug:
+        debug = self.debug
+        # Empty set is the default, bail before the membership probes
+        if not debug:
+            return
+        if level in debug or func in debug:
+            if args:
+                msg = msg % args
             Logger.debug(f'{self._offset}<{type(self).__name__}>({self.name}).{func}() {msg}')
 
     def _update(self, key, parent):
@@ -202,7 +335,7 @@ class Var:
         self.parent = parent
 
     def toDict(self):
-        return self.__dict__
+        return {key: getattr(self, key) for key in self._fields if hasattr(self, key)}
 
     def deepCopy(self, memo=None):
         return copy.deepcopy(self, memo)
@@ -212,12 +345,17 @@ class Var:
         Checks a given value against the type set for this object.
         """
         if value is Null:
-            value = self.value
+            # Fallback covers validation during __init__ before value is set
+            value = getattr(self, 'value', Null)
 
         # Not required, already a null value (either set in config explicitly as null or was inherently null)
         if not self.required and value is Null:
             return True
 
+        # No dtype configured means the check is disabled, skip the register
+        if self.dtype is Null or self.dtype is None:
+            return True
+
         return funcs.getRegister('check_dtype')(value, self.dtype)
 
     def validate(self, value=Null):
@@ -242,31 +380,38 @@ class Var:
             functions as well.
         """
         if value is Null:
-            value = self.value
-
-        # Custom dict, can use e.reduce() to remove e[check]=True
-        errors = ErrorsDict()
+            # Fallback covers validation during __init__ before value is set
+            value = getattr(self, 'value', Null)
 
         # Don't run any checks if the key was missing
         if self.missing:
             if self.required:
+                errors = ErrorsDict()
                 errors['required'] = 'This key is required to be manually set in the config'
+                errors.failed = True
+                return errors
             self._debug(0, 'validate', f'This Var is missing and not required')
-            return errors
+            return EmptyErrors
 
-        # Check the type before anything else
-        errors['type'] = self.checkType()
+        # Nothing to run without a dtype or checks configured, common for plain Vars
+        if not self.checks and (self.dtype is Null or self.dtype is None):
+            return EmptyErrors
 
-        for check in self.checks:
-            args   = []
-            kwargs = {}
-            if isinstance(check, dict):
-                (check, args), = list(check.items())
-                if isinstance(args, dict):
-                    kwargs = args
-                    args = []
+        # Custom dict, can use e.reduce() to remove e[check]=True
+        errors = ErrorsDict()
 
-            errors[check] = funcs.getRegister(check)(self, *args, **kwargs)
+        # Check the type before anything else
+        result = self.checkType(value)
+        errors['type'] = result
+        if isinstance(result, funcs.ReduceTypes):
+            errors.failed = True
+
+        # Checks were parsed to flat tuples when the checks attribute was set
+        for check, args, kwargs in self._parsed:
+            result = funcs.getRegister(check)(self, *args, **kwargs)
+            errors[check] = result
+            if isinstance(result, funcs.ReduceTypes):
+                errors.failed = True
 
         # self._debug(0, 'validate', f'Errors reduced: {errors.reduce()}') # Very spammy, unsure about usefulness
         return errors
@@ -287,7 +432,10 @@ class Var:
         """
         for key, val in defs.items():
             self._debug(0, 'applyDefinition', f'{key} = {val!r}')
-            setattr(self, key, val)
+            try:
+                setattr(self, key, val)
+            except AttributeError:
+                Logger.error(f'Var({self.name}) does not support definitions key: {key!r}')
 
     def replace(self, value):
         """
@@ -295,15 +443,15 @@ class Var:
 
         Work in progress
         """
-        # Find the root parent
-        parent = self.parent
-        while parent._prnt:
-            parent = parent._prnt
-
-        # TODO: This is broken, just default to the global instance until further research
-        parent = None
-
-        replacement = funcs.getRegister('config.replace')(value, parent)
+        # Cheap guard: strings without a magic token or the Null syntax can
+        # never be replaced, skip the register call for them entirely
+        if isinstance(value, str) and '$' not in value and value != '\\':
+            return
+
+        # TODO: Passing the root parent is broken, just default to the global
+        # instance (None) until further research. Walking the parent chain here
+        # was dead code once the result was discarded, so it is removed
+        replacement = funcs.getRegister('config.replace')(value, None)
         if replacement is not value:
             self._debug(0, 'replace', f'Replacing {value!r} with {replacement!r}')
             return replacement
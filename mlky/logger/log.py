@@ -9,7 +9,8 @@ def themeter(name):
         theobj.close()  # or whatever you need to do at exit
 
 
-# usage
-with themeter('/dev/ttyS2') as m:
-    # do what you need with m
-    m.read()
+if __name__ == '__main__':
+    # usage
+    with themeter('/dev/ttyS2') as m:
+        # do what you need with m
+        m.read()
@@ -1,9 +1,10 @@
 """
 Pretty printers
 """
+import builtins
 
 
-def printTable(iterable, enum=False, delimiter='=', offset=1, prepend='', print=print, columns={}, _i=0):
+def printTable(iterable, enum=False, delimiter='=', offset=1, prepend='', print=print, columns={}):
     """
     Parameters can be set on a per column basis using the columns parameter. This is a
     dictionary of column indices as keys and the parameters for that column as the
@@ -27,67 +28,62 @@ def printTable(iterable, enum=False, delimiter='=', offset=1, prepend='', print=
     columns: dict, default={}
         Arguments for each column. Only the delimiter and offset may be different
         between columns. The keys for this are the column number starting from 0
-    _i: int, default=0
-        Which column is being formatted. Used to retrieve column-specific arguments
 
     Returns
     -------
     formatted: list
     """
-    # Retrieve the parameters for this column
-    args      = columns.get(_i, {})
-    delimiter = args.get('delimiter', delimiter)
-    offset    = args.get('offset'   , offset   )
-
-    # Left and right side of the delimiter for this column
-    left  = []
-    right = []
-    for item in iterable:
-        if len(item) > 1:
-            left.append(str(item[0]))
-            right.append(str(item[1]))
-
-    if not left:
-        return []
-
-    padding   = max([0, max(map(len, left))]) + offset
-    formatter = prepend
-    if enum:
-        formatter += '{i:' + f'{len(str(len(iterable)))}' + '}: '
-    formatter += '{left:'+ str(padding) + '}' + delimiter + ' {right}'
-
-    i = 0
-    formatted = []
-    for item in iterable:
-        if len(item) > 1:
-            string = formatter.format(i=i, left=left[i], right=right[i])
-            if len(item) > 2:
-                formatted.append((string, *item[2:]))
-            else:
-                formatted.append((string, ))
-            i += 1
+    # Mutable copies; cell [0] accumulates the formatted string as columns
+    # collapse left to right, avoiding the tuple rebuilds of the old
+    # per-column recursion
+    rows = [list(item) for item in iterable]
+
+    col = 0
+    while True:
+        # Rows still carrying more than one cell participate in this column
+        active = [row for row in rows if len(row) > 1]
+        if not active:
+            # Preserves the original behaviour of returning nothing when no
+            # row has a second column to align
+            if col == 0:
+                return []
+            break
+
+        # Retrieve the parameters for this column; overrides carry forward as
+        # the defaults for later columns
+        args      = columns.get(col, {})
+        delimiter = args.get('delimiter', delimiter)
+        offset    = args.get('offset'   , offset   )
+
+        left    = [str(row[0]) for row in active]
+        padding = max(map(len, left), default=0) + offset
+
+        # Enumeration and prepend only apply to the first column; %-style
+        # substitution skips the format spec parsing that str.format repeats
+        # on every row
+        withEnum  = enum and col == 0
+        formatter = prepend.replace('%', '%%') if col == 0 else ''
+        if withEnum:
+            formatter += f'%{len(str(len(rows)))}d: '
+        formatter += f'%-{padding}s' + delimiter.replace('%', '%%') + ' %s'
+
+        if withEnum:
+            for i, row in enumerate(active):
+                row[:2] = [formatter % (i, left[i], row[1])]
         else:
-            formatted.append(item)
-
-    # Check if there are any more columns to format
-    if any([len(item) > 1 for item in formatted]):
-        # Only delimiter and offset are carried forward, other parameters disabled
-        formatted = printTable(formatted,
-            delimiter = delimiter,
-            offset    = offset,
-            enum      = False,
-            prepend   = '',
-            print     = None,
-            columns   = columns,
-            _i        = _i + 1
-        )
-
-    # Reduce from [(str,), (str,), ...] to [str, str, ...]
-    if _i == 0:
-        formatted = [item for [item] in formatted]
-
-    # Print is only set on the first call
-    if print:
+            for i, row in enumerate(active):
+                row[:2] = [formatter % (left[i], row[1])]
+
+        col += 1
+
+    formatted = [row[0] for row in rows]
+
+    # Stdout gets the whole table in one write; custom print functions such
+    # as loggers keep per-line calls since they add metadata per record
+    if print is builtins.print:
+        if formatted:
+            print('\n'.join(formatted))
+    elif print:
         for item in formatted:
             print(item)
 
@@ -127,19 +123,26 @@ def simpleTable(iterable, enum=False, delimiter='=', offset=1, prepend='', print
     # Determine how much padding between the key and delimiter
     pad = max([1, pad]) + offset
 
-    # Build the formatted string
-    fmt = prepend
+    # Build the formatted string once; %-style substitution skips the format
+    # spec parsing that str.format repeats on every row
+    fmt = prepend.replace('%', '%%')
     if enum:
-        fmt += '- {i:' + f'{len(str(len(iterable)))}' + '}: '
-    fmt += '{key:'+ str(pad) + '}' + delimiter + ' {value}'
+        fmt += f'- %{len(str(len(iterable)))}d: '
+    fmt += f'%-{pad}s' + delimiter.replace('%', '%%') + ' %s'
 
     # Create the formatted list
-    fmt_list = []
-    for i, (key, value) in enumerate(items):
-        string = fmt.format(i=i, key=key, value=value)
-        fmt_list.append(string)
-
-    for string in fmt_list:
-        print(string)
+    if enum:
+        fmt_list = [fmt % (i, key, value) for i, (key, value) in enumerate(items)]
+    else:
+        fmt_list = [fmt % (key, value) for key, value in items]
+
+    # Stdout gets the whole table in one write; custom print functions such
+    # as loggers keep per-line calls since they add metadata per record
+    if print is builtins.print:
+        if fmt_list:
+            print('\n'.join(fmt_list))
+    elif print:
+        for string in fmt_list:
+            print(string)
 
     return fmt_list
@@ -1,6 +1,11 @@
 """
 Function manipulators
 """
+import functools
+import logging
+
+
+Logger = logging.getLogger(__file__)
 
 
 def catch(func):
@@ -17,6 +22,7 @@ def catch(func):
     _wrap: function
         The wrapper function that calls func inside of a try/except block
     """
+    @functools.wraps(func)
     def _wrap(*args, **kwargs):
         """
         Wrapper function
@@ -29,10 +35,8 @@ def catch(func):
             Dict of keyword arguments for func
         """
         try:
-            func(*args, **kwargs)
-        except:
+            return func(*args, **kwargs)
+        except Exception:
             Logger.exception(f'Function <{func.__name__}> raised an exception')
 
-    # Need to pass the docs on for sphinx to generate properly
-    _wrap.__doc__ = func.__doc__
     return _wrap
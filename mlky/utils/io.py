@@ -1,10 +1,18 @@
 """
 IO related utilities
 """
+import copy
+import json
 import os
 import pickle
 import yaml
 
+try:
+    # The libyaml C parser is several times faster than the pure-Python loader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def mkdir(path):
     """
@@ -13,33 +21,47 @@ def mkdir(path):
     # Make sure this is a directory path
     path, _ = os.path.split(path)
 
-    # Split into parts to reconstruct
-    split = path.split('/')
+    # Single syscall instead of a stat+mkdir pair per path component
+    if path:
+        os.makedirs(path, mode=0o771, exist_ok=True)
 
-    # Now reconstruct the path one step at a time and ensure the directory exists
-    for i in range(2, len(split)+1):
-        dir = '/'.join(split[:i])
-        if not os.path.exists(dir):
-            try:
-                os.mkdir(dir, mode=0o771)
-            except Exception as e:
-                Logger.exception(f'Failed to create directory {dir}')
-                raise e
+
+# Parsed YAML files keyed on (path, mtime, size) so repeat loads of an
+# unchanged file skip the parser entirely. Clear to force re-parses
+YamlCache = {}
 
 
 def load_string(string):
     """
     Loads a dict from a string
     """
-    # File case
-    if os.path.exists(string):
-        with open(string, 'r') as file:
-            data = yaml.load(file, Loader=yaml.FullLoader)
+    # File case; stat doubles as the existence check
+    try:
+        stat = os.stat(string)
     # Raw string case
-    else:
-        data = yaml.load(string, Loader=yaml.FullLoader)
+    except (OSError, ValueError):
+        # JSON-looking strings take the much faster json parser first, YAML
+        # remains the fallback since it is a superset
+        if string.lstrip()[:1] in ('{', '['):
+            try:
+                return json.loads(string)
+            except ValueError:
+                pass
+        return yaml.load(string, Loader=YamlLoader)
+
+    key  = (os.path.abspath(string), stat.st_mtime_ns, stat.st_size)
+    data = YamlCache.get(key)
+    if data is None:
+        with open(string, 'r') as file:
+            # .json files skip the YAML state machine entirely
+            if os.path.splitext(string)[1] == '.json':
+                data = json.load(file)
+            else:
+                data = yaml.load(file, Loader=YamlLoader)
+        YamlCache[key] = data
 
-    return data
+    # Callers may mutate the return, a copy protects the cached parse
+    return copy.deepcopy(data)
 
 
 def load_pkl(file):
@@ -56,7 +78,12 @@ def load_pkl(file):
     any
         The data object loaded from the pickle file
     """
-    return pickle.load(open(file, 'rb'))
+    with open(file, 'rb') as f:
+        # One large read beats the unpickler's many small reads for
+        # typical config-sized files
+        if os.fstat(f.fileno()).st_size < (16 << 20):
+            return pickle.loads(f.read())
+        return pickle.load(f)
 
 
 def save_pkl(data, output):
@@ -72,4 +99,4 @@ def save_pkl(data, output):
     """
     mkdir(output)
     with open(output, 'wb') as file:
-        pickle.dump(data, file)
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
@@ -9,18 +9,24 @@ class PrettySlice:
 
     Acts/is a slice object otherwise
     """
+    __slots__ = ('_slice',)
+
     def __init__(self, *args, **kwargs):
         self._slice = slice(*args, **kwargs)
 
-    def __getattribute__(self, key):
+    def __getattr__(self, key):
+        # Only called on misses, normal attribute access pays no override tax.
+        # _slice itself missing (eg. during copy/unpickle before __init__)
+        # must not recurse into this delegation
         if key == '_slice':
-            return super().__getattribute__('_slice')
+            raise AttributeError(key)
         return getattr(self._slice, key)
 
     def __repr__(self):
+        s = self._slice
         r = ':'
-        if self.start is not None:
-            r = str(self.start) + r
-        if self.stop is not None:
-            r += str(self.stop)
+        if s.start is not None:
+            r = str(s.start) + r
+        if s.stop is not None:
+            r += str(s.stop)
         return r